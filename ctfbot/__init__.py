@@ -0,0 +1,3 @@
+__author__ = "IASG Cabinet - (Trent Walraven [trwbox])"
+__copyright__ = "Copyright (C) 2023 IASG"
+__version__ = "0.0.1-alpha"
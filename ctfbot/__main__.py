@@ -0,0 +1,18 @@
+from .bot import CTFBot
+from .config import TOKEN
+from .services import Services
+
+def main():
+    """Connects to the database and starts the bot"""
+    try:
+        services = Services()
+    # If the DB connection fails, print the error and exit since it is required
+    except Exception as e:
+        print(e)
+        exit()
+    bot = CTFBot(services)
+    # Start the bot with the token
+    bot.run(token=TOKEN)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+import discord
+from discord.ext import commands
+from .cogs import EXTENSIONS
+from .config import COMMAND_PREFIX, DESCRIPTION
+from .services import Services
+
+class CTFBot(commands.Bot):
+    """The bot itself. The commands and tasks live in the extensions in ctfbot.cogs,
+    and the connections and caches they share live in services, so the extensions
+    can be reloaded without losing them.
+    """
+
+    def __init__(self, services: Services):
+        """Creates the bot with the shared services
+
+        Args:
+            services (Services): The connections and caches shared by the extensions
+        """
+        # The intents for the bot
+        intents = discord.Intents.default()
+        # The bot needs to be able to get members and message content along with the default intents
+        intents.members = True
+        intents.message_content = True
+        super().__init__(command_prefix=COMMAND_PREFIX, description=DESCRIPTION, intents=intents)
+        self.services = services
+
+    async def setup_hook(self):
+        """Loads all of the extensions and starts watching the database for credential
+        changes. This runs once, before the bot connects to Discord.
+        """
+        for extension in EXTENSIONS:
+            await self.load_extension(extension)
+        self.services.credential_cache.start_watching()
+
+    async def on_ready(self):
+        """The function that runs when the bot is ready to be used. It will print the
+        bot's name and ID to the console. It will also restart watching the database
+        for credential changes, if the watcher stopped.
+        """
+        print(f'Logged in as {self.user} (ID: {self.user.id})')
+        print('------')
+        # If the change stream couldn't be opened the watcher gives up, so try again
+        # after every reconnect
+        self.services.credential_cache.start_watching()
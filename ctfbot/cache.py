@@ -0,0 +1,218 @@
+import threading
+import time
+from collections import OrderedDict
+from pymongo.errors import OperationFailure, PyMongoError
+from .config import CACHE_MAX_ENTRIES, WATCH_RETRY_SECONDS
+
+class CredentialCache:
+    """An in-process read-through cache of the credentials for each CTF ID.
+
+    Every CTF ID that has been looked up is stored, including CTF IDs that have
+    no credentials (stored as an empty list), so repeated lookups for a CTF without
+    credentials also skip the database. Only the most recently used CTF IDs are
+    kept, so looking up lots of made up CTF IDs can't grow the cache forever.
+    Entries are dropped by the bot's own writes
+    through invalidate(), and by a MongoDB change stream for writes made outside
+    of the bot. If the change stream can not be used, the cache is disabled and
+    every lookup goes to the database like before.
+    """
+
+    def __init__(self, collection):
+        """Creates an empty cache for a collection
+
+        Args:
+            collection (pymongo.collection.Collection): The collection holding the credentials
+        """
+        self.collection = collection
+        # ctf_id -> list of credential dicts, an empty list means there are no credentials
+        # Kept in least recently used order so the oldest can be removed when it is full
+        self._credentials = OrderedDict()
+        # Document _id -> ctf_id for every cached document, since delete events
+        # from the change stream only include the _id of the document
+        self._document_ids = {}
+        # ctf_id -> list of document _ids, so a CTF ID can be dropped without
+        # searching all of _document_ids
+        self._documents = {}
+        # ctf_id -> number of database reads running for it
+        self._reads = {}
+        # ctf_id -> number of times it has been invalidated while a read was running,
+        # and the number of times an invalidation couldn't be tied to a CTF ID. Used
+        # to make sure a database read that raced with an invalidation is not stored
+        self._generations = {}
+        self._epoch = 0
+        # The cache is read from the event loop and invalidated from the watcher thread
+        self._lock = threading.Lock()
+        self._watcher = None
+        # Only cache once the change stream is open, otherwise writes made outside
+        # of the bot would never be seen
+        self.enabled = False
+
+    def get(self, ctf_id: int) -> list:
+        """Gets the credentials for a CTF ID, from the cache if possible and from
+        the database otherwise
+
+        Args:
+            ctf_id (int): The CTFTime ID of the CTF
+
+        Returns:
+            list: A list of credential dicts with "team_name" and "team_password" keys,
+            empty if there are no credentials for the CTF
+        """
+        with self._lock:
+            if self.enabled and ctf_id in self._credentials:
+                self._credentials.move_to_end(ctf_id)
+                return list(self._credentials[ctf_id])
+            generation = (self._epoch, self._generations.get(ctf_id, 0))
+            self._reads[ctf_id] = self._reads.get(ctf_id, 0) + 1
+        try:
+            # Only the fields needed for the cache are pulled from the database
+            documents = list(self.collection.find({"ctf_id": ctf_id}, {"credentials": 1}))
+            credentials = [document.get("credentials") for document in documents]
+            with self._lock:
+                # If the CTF ID was invalidated while the database was being read, the
+                # result might already be out of date, so don't store it. This has to
+                # be checked before the read is finished, since that forgets the generation
+                if self.enabled and (self._epoch, self._generations.get(ctf_id, 0)) == generation:
+                    self._store(ctf_id, credentials, [document.get("_id") for document in documents])
+        finally:
+            with self._lock:
+                self._finish_read(ctf_id)
+        return list(credentials)
+
+    def _finish_read(self, ctf_id: int):
+        """Marks a database read for a CTF ID as done. The lock must already be held."""
+        self._reads[ctf_id] = self._reads[ctf_id] - 1
+        # Generations only matter while a read is running, so forget them afterwards
+        if self._reads[ctf_id] == 0:
+            del self._reads[ctf_id]
+            self._generations.pop(ctf_id, None)
+
+    def _store(self, ctf_id: int, credentials: list, document_ids: list):
+        """Adds a CTF ID to the cache, removing the least recently used CTF IDs if
+        the cache is full. The lock must already be held.
+        """
+        self._remove(ctf_id)
+        self._credentials[ctf_id] = credentials
+        self._documents[ctf_id] = document_ids
+        for document_id in document_ids:
+            self._document_ids[document_id] = ctf_id
+        while len(self._credentials) > CACHE_MAX_ENTRIES:
+            self._remove(next(iter(self._credentials)))
+
+    def invalidate(self, ctf_id: int = None):
+        """Removes a CTF ID from the cache, or every CTF ID if none is given
+
+        Args:
+            ctf_id (int, optional): The CTFTime ID of the CTF to remove. Defaults to None.
+        """
+        with self._lock:
+            if ctf_id is None:
+                self._clear()
+                return
+            self._drop(ctf_id)
+
+    def _clear(self):
+        """Removes every CTF ID from the cache. The lock must already be held."""
+        self._credentials.clear()
+        self._document_ids.clear()
+        self._documents.clear()
+        self._generations.clear()
+        self._epoch = self._epoch + 1
+
+    def _drop(self, ctf_id: int):
+        """Removes a single CTF ID from the cache, and throws away any read for it
+        that is running. The lock must already be held.
+        """
+        self._remove(ctf_id)
+        if ctf_id in self._reads:
+            self._generations[ctf_id] = self._generations.get(ctf_id, 0) + 1
+
+    def _remove(self, ctf_id: int):
+        """Removes a single CTF ID and its documents from the cache. The lock must
+        already be held.
+        """
+        self._credentials.pop(ctf_id, None)
+        for document_id in self._documents.pop(ctf_id, []):
+            self._document_ids.pop(document_id, None)
+
+    def _handle_change(self, change: dict):
+        """Invalidates the cache for a single change stream event
+
+        Args:
+            change (dict): The change stream event
+        """
+        operation = change.get("operationType")
+        # The collection was dropped or renamed, nothing cached can be trusted
+        if operation not in ("insert", "update", "replace", "delete"):
+            self.invalidate()
+            return
+        document_id = change.get("documentKey", {}).get("_id")
+        with self._lock:
+            # The CTF ID the document had when it was cached
+            if document_id in self._document_ids:
+                self._drop(self._document_ids[document_id])
+            # A delete for a document that isn't cached can't be tied to a CTF ID, but
+            # it could have been found by a read that is still running. Cached CTF IDs
+            # know all of their documents, so only the running reads are thrown away
+            elif operation == "delete" and len(self._reads) > 0:
+                self._epoch = self._epoch + 1
+            # The CTF ID the document has now, for inserts and updates
+            full_document = change.get("fullDocument")
+            if full_document is not None and "ctf_id" in full_document:
+                self._drop(full_document.get("ctf_id"))
+            # An update without the new document could have moved it to any CTF ID
+            elif operation in ("update", "replace"):
+                self._clear()
+
+    def _watch(self):
+        """Follows the change stream for the collection, invalidating the cache for
+        every change. This blocks, so it is run in its own thread by start_watching.
+        """
+        resume_token = None
+        try:
+            while True:
+                try:
+                    with self.collection.watch(full_document="updateLookup", resume_after=resume_token) as stream:
+                        with self._lock:
+                            # Reads that started while the cache was off could have
+                            # missed writes made before the stream opened, so throw
+                            # them away before turning the cache on
+                            self._clear()
+                            self.enabled = True
+                        print("Watching the database for credential changes")
+                        for change in stream:
+                            self._handle_change(change)
+                            resume_token = stream.resume_token
+                # Change streams need a replica set, so without one there is no way to
+                # know about outside writes and the cache has to stay off
+                except OperationFailure as e:
+                    print("Credential cache disabled, change stream failed: {}".format(e))
+                    with self._lock:
+                        self.enabled = False
+                    self.invalidate()
+                    # If the resume token is too old, start a fresh stream instead
+                    if resume_token is not None:
+                        resume_token = None
+                        time.sleep(WATCH_RETRY_SECONDS)
+                        continue
+                    return
+                except PyMongoError as e:
+                    print("Credential change stream error, retrying: {}".format(e))
+                    # Changes could have been missed while the stream was down
+                    with self._lock:
+                        self.enabled = False
+                    self.invalidate()
+                    time.sleep(WATCH_RETRY_SECONDS)
+        finally:
+            # However the watcher stops, nothing is invalidating the cache any more,
+            # so it has to be turned off
+            with self._lock:
+                self.enabled = False
+                self._clear()
+
+    def start_watching(self):
+        """Starts the change stream watcher thread, if it is not already running"""
+        if self._watcher is not None and self._watcher.is_alive():
+            return
+        self._watcher = threading.Thread(target=self._watch, name="credential-watcher", daemon=True)
+        self._watcher.start()
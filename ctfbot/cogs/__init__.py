@@ -0,0 +1,7 @@
+# The extensions that are loaded when the bot starts, and reloaded by the reload command
+EXTENSIONS = [
+    "ctfbot.cogs.admin",
+    "ctfbot.cogs.ctf",
+    "ctfbot.cogs.credentials",
+    "ctfbot.cogs.database",
+]
@@ -0,0 +1,64 @@
+from discord.ext import commands
+from . import EXTENSIONS
+
+class Admin(commands.Cog):
+    """The commands for managing the bot itself"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+
+    @commands.command("reload")
+    async def reload(self, ctx, *names):
+        """Reloads the given extensions, or all of them if none are given, without
+        restarting the bot. The gateway connection, the MongoDB client and the
+        credential cache are kept. Only the extensions are reloaded, so changes to
+        the shared modules (config, utils, services, cache) still need a restart.
+        The credential change stream watcher is restarted if it had stopped.
+
+        Args:
+            ctx (discord.ext.commands.Context): The context of the command
+            *names: The extensions to reload, either the full name like
+                ctfbot.cogs.ctf or just the last part like ctf
+        """
+        # Don't respond to bots to prevent infinite loops
+        if ctx.author.bot:
+            return
+        # Check that the user has the role "Cabinet" to prevent abuse
+        if not any(role.name == "Cabinet" for role in ctx.author.roles):
+            await ctx.send("Error: You do not have permission to use this command")
+            return
+        # Allow just the last part of the extension name to be given
+        if len(names) == 0:
+            extensions = EXTENSIONS
+        else:
+            extensions = [name if "." in name else "ctfbot.cogs." + name for name in names]
+        output = []
+        for extension in extensions:
+            # A failed reload rolls back to the old version, so the bot keeps working
+            try:
+                await self.bot.reload_extension(extension)
+                output.append("Reloaded `{}`".format(extension))
+            except commands.ExtensionError as e:
+                print(e)
+                output.append("Failed to reload `{}`: {}".format(extension, e))
+        # The watcher isn't part of an extension, so restart it here if it had given up
+        self.bot.services.credential_cache.start_watching()
+        await ctx.send("\n".join(output))
+
+    @commands.command('testing')
+    async def testing(self, ctx, *args):
+        """Testing command that states if the user is in the Cabinet role or not"""
+        print(ctx.channel.id)
+        if ctx.author.bot:
+            return
+        #cabinet = discord.role(998336323154878524, 'Cabinet')
+        for i in ctx.author.roles:
+            if i.name == "Cabinet":
+                await ctx.send("User is in Cabinet")
+        await ctx.send("Testing")
+        args = ', '.join(args)
+        await ctx.send(args)
+
+async def setup(bot: commands.Bot):
+    """Adds the admin commands to the bot when the extension is loaded"""
+    await bot.add_cog(Admin(bot))
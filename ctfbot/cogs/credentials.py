@@ -0,0 +1,336 @@
+import asyncio
+import discord
+import io
+from typing import Union
+from discord.ext import commands
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+from ..config import BULK_LOOKUP_LIMIT, COMMAND_PREFIX, EVENT_URL
+from ..utils import convert_timestamps, parse_bulk_credentials
+
+class Credentials(commands.Cog):
+    """The commands for adding CTF team names and passwords to the database"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        # The shared connections and caches, these outlive reloads of this extension
+        self.services = bot.services
+
+    @commands.command("ctf_pass")
+    async def ctfPass(self, ctx, id: Union[int, str] = None, team_name: str = None, team_password: str = None, overwrite: Union[bool, str] = False,  *args):
+        """A method for setting the team name and password for a CTF. This will check the database
+        for the CTF ID, and a team name. If the team name already exists, it will send an error message
+        unless the overwrite flag is set to true. If the overwrite flag is set to true, it will delete
+        the existing document from the database and create a new one with the new credentials. If passed
+        only a CTF ID, it will run the ctf_info command with the given ID instead.
+
+        Args:
+            ctx (discord.ext.commands.Context): The context of the command
+            id (Union[int, str], required): The CTF ID to set the credentials for. Defaults to None.
+            team_name (str, required): The team name to set. Defaults to None.
+            team_password (str, required): The team password to set. Defaults to None.
+            overwrite (Union[bool, str], optional): A flag to overwrite existing credentials. Defaults to False.
+            *args: Any extra arguments that are passed in. These are not used, but will prevent
+                the bot from throwing an error if the user passes in extra arguments.
+        """
+        overwrote = False
+        # If there is just a CTF ID, then get the team name and password from the database
+        # This does not require cabinet permissions
+        if id is not None and team_name is None and team_password is None:
+            # Try to convert the id to an integer, if the auto convert fails
+            try:
+                id = int(id)
+            except ValueError:
+                ctx.send("Error: ID must be an integer", delete_after=10)
+                await asyncio.sleep(10)
+                await ctx.message.delete()
+                return
+            # If the number is an integer, we can just run the ctf_info command
+            ctf_info = self.bot.get_command("ctf_info")
+            # The ctf_info command is in another extension, which might not be loaded
+            if ctf_info is None:
+                await ctx.send("Error: The ctf_info command is not currently loaded, please ask a cabinet member to reload the bot", delete_after=10)
+                return
+            await ctx.invoke(ctf_info, id)
+            return
+        # If there is more than just an id provided, check for required fields
+        elif id is None or team_name is None or team_password is None:
+            # If any of the required fields are not provided, send an error message
+            # that will be deleted after 10 seconds
+            await ctx.send(f"Error: Required field not provided\nCommand Usage: `{COMMAND_PREFIX}ctf_pass <ctf_id_int> <team_name_str> <team_password_str> [overwrite_bool Optional]`", delete_after=10)
+            # Wait 10 seconds
+            await asyncio.sleep(10)
+            # Delete the command message
+            await ctx.message.delete()
+            # Return to prevent further execution
+            return
+        # Check for correct types on all the fields
+        elif type(id) != int or type(team_name) != str or type(team_password) != str or type(overwrite) != bool:
+            # Send an error message about required types that will be deleted after 10 seconds
+            await ctx.send(f"Error: Required field has incorrect type\nCommand Usage: `{COMMAND_PREFIX}ctf_pass <ctf_id_int> <team_name_str> <team_password_str> [overwrite_bool Optional]`", delete_after=10)
+            # Wait 10 seconds
+            await asyncio.sleep(10)
+            # Delete the command message
+            await ctx.message.delete()
+            # Return to prevent further execution
+            return
+        # Check that the user has the role "Cabinet" to prevent abuse
+        elif not any(role.name == "Cabinet" for role in ctx.author.roles):
+            # TODO: Make this instead create a 
+            # Send an error message
+            await ctx.send("Error: You do not have permission to use this command, please request a cabinet member add the credentials")
+            # Return to prevent further execution
+            return
+
+        # Try to get the data for the ctf_id from the database
+        # This will get every document with the ctf_id, so there could be multiple
+        mongo_data = self.services.collection.find({"ctf_id": id})
+        # An array to store all the credentials for the CTF
+        current_creds = []
+        # If there was data found
+        if mongo_data is not None:
+            # Iterate over all the data
+            while mongo_data.alive:
+                # Try to get the next document from the query
+                try:
+                    # Store that data in a variable, this can trigger a StopIteration error
+                    data = mongo_data.next()
+                    # Add the mongo document to the array
+                    current_creds.append(data)
+                except StopIteration:
+                    break
+
+        # This could probably be done with a query
+        # TODO: Make this a query instead of iterating over all the data
+
+        # If there were creds parsed from the database
+        if len(current_creds) > 0:
+            # For all the documents in the array
+            for creds in current_creds:
+                # Get the credentials dictionary from the document
+                temp = creds.get("credentials")
+                # If the team name given is the same as a name that already exists, and overwrite is false
+                if temp.get("team_name") == team_name and not overwrite:
+                    # Send an error message that will be deleted after 10 seconds
+                    await ctx.send("Error: Team name \"{}\" already exists for CTF ID {}".format(team_name, id), delete_after=10)
+                    await ctx.send("Use the overwrite flag to overwrite the existing team password", delete_after=10)
+                    # Wait 10 seconds
+                    await asyncio.sleep(10)
+                    # Delete the command message
+                    await ctx.message.delete()
+                    # Return to prevent further execution
+                    return
+                # If overwrite is true, delete the existing document from the database
+                elif temp.get("team_name") == team_name and overwrite:
+                    # Delete by the _id of the document since it is unique
+                    self.services.collection.delete_one({"_id": creds.get("_id")})
+                    self.services.credential_cache.invalidate(id)
+                    # Set overwrote to true so the bot can send a different message
+                    overwrote = True
+                    break
+
+        # Get the CTF data from ctftime
+        # Print the URL for debugging
+        print(EVENT_URL.format(id))
+        response = self.services.http.get(EVENT_URL.format(id))
+        # If the response status code is not 200, send an error message
+        if response.status_code != 200:
+            # Send an error about the api response
+            await ctx.send("Error: CTFTime API returned status code {}".format(response.status_code))
+            # Return to prevent further execution
+            return
+        # Get the JSON data from the response if it succeeded
+        data = response.json()
+        # If the data is empty, 
+        if len(data) == 0:
+            # Send an error message that the CTF ID was not found if the data is empty
+            await ctx.send("CTF ID not found on CTFTime API")
+            # Return to prevent further execution
+            return
+
+        # Get the start and finish timestamps from the data
+        output = convert_timestamps(data.get("start"), data.get("finish"))
+        # Create an empty dict for the database data
+        database_data = {}
+        # In the credentials section, create another dict for the team name and password
+        database_data["credentials"] = {}
+        # Add the team name and password to the credentials dict
+        database_data["credentials"]["team_name"] = team_name
+        database_data["credentials"]["team_password"] = team_password
+        # Add the name, and url to 
+        database_data["title"] = data.get("title")
+        # Add the ctf_id to the database data
+        database_data["ctf_id"] = id
+        # Add the unix timestamps to the database data, for cleaning up the database
+        # later
+        database_data["start"] = output.get("start_timestamp")
+        database_data["finish"] = output.get("finish_timestamp")
+
+        # Add the database data to the database
+        # Insert the data into the database
+        self.services.collection.insert_one(database_data)
+        # Drop the cached credentials so the new ones are seen right away, without
+        # waiting for the change stream
+        self.services.credential_cache.invalidate(id)
+        # Send a success message
+        embed = discord.Embed()
+        # Set the title of the embed
+        embed.title = "CTF Password Added"
+        # If the team was overwritten, send a different message
+        if overwrote:
+            embed.description = "CTF team {} already existed in the database, overwriting".format(team_name)
+        # Attempt to get the CTFs logo
+        logo_url = data.get("logo")
+        file = None
+        # If there is a logo URL
+        if logo_url is not None and logo_url != "":
+            # Attempt to get the logo data
+            logo_data = self.services.http.get(logo_url)
+            # If the status code is 200, the logo was found
+            if logo_data.status_code == 200:
+                # Create a file object from the logo data
+                file = io.BytesIO(logo_data.content)
+            # If the status code is not 200, the logo was not found
+            else:
+                # Set the file to None
+                file = None
+        # If there is no url, set the file to None
+        else:
+            file = None
+        # If there is a file, and the logo data status code is 200
+        if file != None and logo_data.status_code == 200:
+            # Add the file to the embed
+            test = discord.File(file, filename="logo.png")
+            # Set the thumbnail to the file
+            embed.set_thumbnail(url="attachment://logo.png")
+        # Add the CTF Name field
+        embed.add_field(name="CTF Name", value=data.get("title"), inline=False)
+        # Add the CTF ID field
+        embed.add_field(name="CTF ID", value=id, inline=False)
+        # Add the Team Name field
+        embed.add_field(name="Team Name", value=team_name, inline=False)
+        # Add the Team Password field
+        embed.add_field(name="Team Password", value=team_password, inline=False)
+        # If a logo was found, send the file with the embed
+        if file != None and logo_data.status_code == 200:
+            await ctx.send(file=test, embed=embed)
+        # If no logo was found, send the embed without the file
+        else:
+            await ctx.send(embed=embed)
+
+    @commands.command("ctf_pass_bulk")
+    async def ctf_pass_bulk(self, ctx, *args):
+        """A method for setting the team names and passwords for many CTFs at once from an
+        attached CSV or JSON file. Every CTF ID in the file is checked against the CTFTime
+        API, and all the credentials for known CTFs are written to the database at once.
+        Existing credentials with the same CTF ID and team name are overwritten. Sends a
+        single summary message when done.
+
+        Args:
+            ctx (discord.ext.commands.Context): The context of the command
+            *args: Any extra arguments that are passed in. These are not used, but will prevent
+                the bot from throwing an error if the user passes in extra arguments.
+        """
+        # Don't respond to bots to prevent infinite loops
+        if ctx.author.bot:
+            return
+        # Check that the user has the role "Cabinet" to prevent abuse
+        if not any(role.name == "Cabinet" for role in ctx.author.roles):
+            await ctx.send("Error: You do not have permission to use this command, please request a cabinet member add the credentials")
+            return
+        # Check that there is a file to import
+        if len(ctx.message.attachments) != 1:
+            await ctx.send(f"Error: Attach a single CSV or JSON file\nCommand Usage: `{COMMAND_PREFIX}ctf_pass_bulk` with a file of `ctf_id,team_name,team_password` rows", delete_after=10)
+            await asyncio.sleep(10)
+            await ctx.message.delete()
+            return
+        attachment = ctx.message.attachments[0]
+        # Read and parse the attached file
+        try:
+            credentials, errors = parse_bulk_credentials(attachment.filename, await attachment.read())
+        except ValueError as e:
+            await ctx.send("Error: Could not read {}: {}".format(attachment.filename, e), delete_after=10)
+            return
+        # If the same team is in the file more than once, only keep the last one
+        # so the upserts don't race with each other
+        unique_credentials = {}
+        for ctf_id, team_name, team_password in credentials:
+            unique_credentials[(ctf_id, team_name)] = team_password
+
+        # Look up every CTF ID once, with a few requests running at the same time
+        ctf_ids = sorted(set(ctf_id for ctf_id, _ in unique_credentials))
+        semaphore = asyncio.Semaphore(BULK_LOOKUP_LIMIT)
+        async def lookup(ctf_id: int):
+            async with semaphore:
+                return await asyncio.to_thread(self.services.get_ctf_event, ctf_id)
+        results = await asyncio.gather(*[lookup(ctf_id) for ctf_id in ctf_ids])
+        events = {}
+        missing = []
+        failed = []
+        for ctf_id, (data, error) in zip(ctf_ids, results):
+            events[ctf_id] = data
+            # Keep CTF IDs that don't exist apart from lookups that failed, since
+            # the failed ones can just be tried again later
+            if error == "not found":
+                missing.append(ctf_id)
+            elif error is not None:
+                failed.append("{} ({})".format(ctf_id, error))
+
+        # Create an upsert for every set of credentials for a CTF that was found
+        operations = []
+        for (ctf_id, team_name), team_password in unique_credentials.items():
+            data = events[ctf_id]
+            if data is None:
+                continue
+            # Get the start and finish timestamps from the data
+            output = convert_timestamps(data.get("start"), data.get("finish"))
+            operations.append(UpdateOne(
+                {"ctf_id": ctf_id, "credentials.team_name": team_name},
+                {"$set": {
+                    "credentials": {"team_name": team_name, "team_password": team_password},
+                    "title": data.get("title"),
+                    "ctf_id": ctf_id,
+                    "start": output.get("start_timestamp"),
+                    "finish": output.get("finish_timestamp")
+                }},
+                upsert=True
+            ))
+
+        added = 0
+        updated = 0
+        if len(operations) > 0:
+            # Write everything at once, unordered so one failure doesn't stop the rest
+            try:
+                result = self.services.collection.bulk_write(operations, ordered=False)
+                added = result.upserted_count
+                updated = result.matched_count
+            except BulkWriteError as e:
+                added = e.details.get("nUpserted", 0)
+                updated = e.details.get("nMatched", 0)
+                for error in e.details.get("writeErrors", []):
+                    errors.append("Database: {}".format(error.get("errmsg")))
+            # Drop the cached credentials for everything that was written
+            for ctf_id in ctf_ids:
+                if events[ctf_id] is not None:
+                    self.services.credential_cache.invalidate(ctf_id)
+
+        # Send a summary of the import
+        embed = discord.Embed()
+        embed.title = "CTF Passwords Imported"
+        embed.add_field(name="Added", value=added, inline=True)
+        embed.add_field(name="Overwritten", value=updated, inline=True)
+        embed.add_field(name="CTFs", value=len(ctf_ids) - len(missing) - len(failed), inline=True)
+        # If any CTF IDs weren't found, list them
+        if len(missing) > 0:
+            embed.add_field(name="CTF IDs not found on CTFTime", value=", ".join(str(ctf_id) for ctf_id in missing)[:1024], inline=False)
+        # If any lookups failed, list them so they can be tried again
+        if len(failed) > 0:
+            embed.add_field(name="CTFTime lookups failed, try these again", value=", ".join(failed)[:1024], inline=False)
+        # If any rows couldn't be used, list them
+        if len(errors) > 0:
+            embed.add_field(name="Skipped", value="\n".join(errors)[:1024], inline=False)
+        await ctx.send(embed=embed)
+
+async def setup(bot: commands.Bot):
+    """Adds the credential commands to the bot when the extension is loaded"""
+    await bot.add_cog(Credentials(bot))
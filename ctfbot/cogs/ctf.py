@@ -0,0 +1,346 @@
+import asyncio
+import discord
+import io
+from typing import Union
+from discord.ext import commands
+from ..config import COMMAND_PREFIX, CTF_LIMIT, EVENT_URL, GENERAL_URL
+from ..utils import convert_timestamps, get_times
+
+class CTF(commands.Cog):
+    """The commands for looking up CTFs on CTFTime"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        # The shared connections and caches, these outlive reloads of this extension
+        self.services = bot.services
+
+    @commands.command("ctf")
+    async def ctf(self, ctx, days: Union[int, str] = 7, *args):
+        """Gets up to 100 CTFs in the specified number of days. Default is 7. W
+        This will skip onsite CTFs by default, but this can be changed by setting
+        This will also skip non Open CTFs by default.
+
+        Args:
+            ctx (discord.ext.commands.Context): The context of the command
+            days (Union[int, str], optional): The number of days to get CTFs for. Defaults to 7.
+                Needs to be an integer, but the Union allows for a string to be passed in, and
+                an error will be sent if it is not an integer.
+            *args: Any extra arguments that are passed in. These are not used, but will prevent
+                the bot from throwing an error if the user passes in extra arguments.
+        Returns:
+            None: Returns nothing
+        """
+        # A variable that can be set if you want ot skip onsite CTFs
+        # Default to hardcoding right now, but might make it an option later?
+        skip_onsite = True
+        # A variable that can be set if you want to skip non Open CTFs
+        # Default to hardcoding right now, but might make it an option later?
+        skip_non_open = True
+
+        # Don't respond to bots to prevent infinite loops
+        if ctx.author.bot:
+            return
+
+        # Check if the days is an integer
+        if type(days) != int:
+            # Send a message to the user telling them that the days needs to be an integer
+            # The message will be deleted after 5 seconds
+            await ctx.send(f"Days must be an integer\nUsage: `{COMMAND_PREFIX}ctf <days_int>`", delete_after=5)
+            # Wait 5 seconds then delete the command message alongside the bot's message
+            await asyncio.sleep(5)
+            # Delete the command message
+            await ctx.message.delete()
+            # Return to prevent the bot from continuing
+            return
+        # Check if the days is less than or equal to 30
+        if days > 30:
+            # Send a message to the user telling them that the days needs to be less than or equal to 30
+            # The message will be deleted after 5 seconds
+            await ctx.send("Please specify a number of days less than or equal to 30", delete_after=5)
+            # Wait 5 seconds then delete the command message alongside the bot's message
+            await asyncio.sleep(5)
+            # Delete the command message
+            await ctx.message.delete()
+            return
+        # TODO: To get the current CTFs from the API it looks like it might require setting the start time back X days, 
+        #   getting the ctfs, then parsing the finish data to see if it has passed. Then only adding the ones that have not
+        #   you could then also compute the hours and days left in the ctf and add that to the embed?
+        # Get the current and future timestamps
+        current, future = get_times(days=days)
+        # Print the URL for debugging
+        print(GENERAL_URL.format(CTF_LIMIT, current, future))
+        # Get the response from the API
+        response = self.services.http.get(GENERAL_URL.format(CTF_LIMIT, current, future))
+        # Convert to JSON
+        if response.status_code != 200:
+            # Send a message to the user telling them that there was an error
+            await ctx.send("Error CTFTime API returned: {}".format(response.status_code))
+            # Return to prevent the bot from continuing
+            return
+        # Convert to JSON
+        data = response.json()
+        # If there is no data, there are no CTFs in the next 7 days
+        if len(data) == 0:
+            await ctx.send("No CTFs found in the next {} days".format(days))
+            return
+        # Create temp variables outside the loop
+        output = ""
+        file = None
+        # For all of the CTFs in the response
+        for i in data:
+            # If the CTF is not open, skip it
+            if skip_non_open and i.get("restrictions") != "Open":
+                continue
+            # If the CTF is onsite, skip it
+            if skip_onsite and i.get("onsite") != False:
+                continue
+            # Get the logo URL
+            logo_url = i.get("logo")
+            # If there is a logo URL
+            if logo_url is not None and logo_url != "":
+                # Attempt to get the logo data
+                logo_data = self.services.http.get(logo_url)
+                # If the status code is 200, the logo was found
+                if logo_data.status_code == 200:
+                    # Create a file object from the logo data
+                    file = io.BytesIO(logo_data.content)
+                else:
+                    # If the status code is not 200, the logo was not found
+                    # Set the file to None
+                    file = None
+            else:
+                # If there is no logo, set the file to None
+                file = None
+            # Create a new embed message
+            embed = discord.Embed()
+            # If there is a file, and the logo data status code is 200
+            if file != None and logo_data.status_code == 200:
+                # Add the file to the embed
+                test = discord.File(file, filename="logo.png")
+                # Set the thumbnail to the file
+                embed.set_thumbnail(url="attachment://logo.png")
+            # Add the fields to the embed, some fields are used more than once
+            # so they are stored in variables
+            # The ID of the CTF
+            ctf_id = i.get("id")
+            # Get all the credentials for the ctf_id, from the cache or the database
+            team_creds = self.services.credential_cache.get(ctf_id)
+            # If there were no creds found, set it to None for easier checking later
+            if len(team_creds) == 0:
+                team_creds = None
+
+            # The start and finish times of the CTF in unix, and central time
+            output = convert_timestamps(i.get("start"), i.get("finish"))
+            # The duration of the CTF in days and hours
+            duration = i.get("duration")
+            # The description of the CTF
+            description = i.get("description")
+
+            # The name of the CTF
+            embed.add_field(name="Name", value=i.get("title"), inline=True)
+            # The ID of the CTF
+            embed.add_field(name="CTF ID", value=ctf_id, inline=True)
+            # The URL of the CTF
+            embed.add_field(name="URL", value=i.get("url"), inline=False)
+            # The start and finish strings for Central Time Zone
+            embed.add_field(name="Start", value=output.get("start_string"), inline=True)
+            embed.add_field(name="Finish", value=output.get("finish_string"), inline=True)
+            # The format of the CTF
+            embed.add_field(name="Format", value=i.get("format"), inline=True)
+            # If the durations is not empty
+            if duration is not None and duration != "":
+                # Create a string for the duration
+                duration_string = "Days: " + str(duration.get("days")) + "\nHours: " + str(duration.get("hours"))
+                # Add the duration string to the embed
+                embed.add_field(name="Duration", value=duration_string, inline=True)
+            # If there is team data
+            if team_creds is not None:
+                # If there are more than 1 set of credentials
+                if len(team_creds) > 1:
+                    # Create empty strings for the team names and passwords
+                    team_names = ""
+                    team_passes = ""
+                    # For all the credentials in the list
+                    for data in team_creds:
+                        # If the team names string is empty, set it to the team name
+                        if len(team_names) == 0:
+                            team_names = data.get("team_name")
+                            team_passes = data.get("team_password")
+                        # If the team names string is not empty, add a comma and newline
+                        else:
+                            team_names = team_names + ",\n" + data.get("team_name")
+                            team_passes = team_passes + ",\n" + data.get("team_password")
+                    # Add the team names and passwords to the embed
+                    embed.add_field(name="Team Names", value=team_names, inline=True)
+                    embed.add_field(name="Team Passwords", value=team_passes, inline=True)
+                # If there is only 1 set of credentials
+                elif len(team_creds) == 1:
+                    # Add the team name and password to the embed
+                    embed.add_field(name="Team Name", value=team_creds[0].get("team_name"), inline=True)
+                    embed.add_field(name="Team Password", value=team_creds[0].get("team_password"), inline=True)
+            # If there are no credentials
+            else:
+                # If there is no team data, add None to the fields
+                embed.add_field(name="Team Name", value="None", inline=True)
+                embed.add_field(name="Team Password", value="None", inline=True)
+
+            # If there is a description
+            if description is not None and description != "":
+                # If the description is longer than 1024 characters, truncate it
+                if len(description) > 1024:
+                    description = description[:1024]
+                # Add the description to the embed
+                embed.add_field(name="Description", value=description, inline=False)
+
+            # If a logo was found, send the file with the embed
+            if file != None and logo_data.status_code == 200:
+                await ctx.send(file=test, embed=embed)
+            # If no logo was found, send the embed without the file
+            else:
+                await ctx.send(embed=embed)
+
+    @commands.command("ctf_info")
+    async def ctf_info(self, ctx, id: Union[str, int] = None, *args):
+        """Gets information about a specific CTF, if a specific CTF ID is given, will always
+        succeed. If given a string, it will search for the string in the CTF names over the 
+        next 14 days, and return the first one. Deletes the user's message on success.
+
+        Args:
+            ctx (discord.ext.commands.Context): The context of the command
+            id (Union[str, int], optional): The data the user provides to search for a CTF. 
+                Can be a string to search for a name, or an id for a specific CTF. Defaults to None.
+            *args: Any extra arguments that are passed in. These are not used, but will prevent
+                the bot from throwing an error if the user passes in extra arguments.
+        """
+        # Don't respond to bots to prevent infinite loops
+        if ctx.author.bot:
+            return
+        # Try to convert the id to an integer, if the auto convert fails
+        try:
+            id = int(id)
+        except ValueError:
+            pass
+
+        # If the id is still a string, search for CTFs by name
+        # TODO: This is a placeholder, it will be implemented later
+        if type(id) == str:
+            await ctx.send("Searching for CTFs by name", delete_after=10)
+            await ctx.send("This function is not currently implemented", delete_after=10)
+            return 
+        # If the id is an integer, the user is searching for a specific CTF, so get the data
+        # from the API for that CTF
+        elif type(id) == int:
+            # Get the credentials for the CTF ID, from the cache or the database
+            team_data = self.services.credential_cache.get(id)
+            # If there was no data found, set the team data to None
+            if len(team_data) == 0:
+                team_data = None
+
+            # Create the API URL for the CTF
+            api_url = EVENT_URL.format(id)
+            # Print the URL for debugging
+            print(api_url)
+            # Get the response from the API for the url
+            response = self.services.http.get(api_url)
+            # If the response status code is not 200, send an error message
+            if response.status_code != 200:
+                await ctx.send("Error: CTFTime API returned status code {}".format(response.status_code), delete_after=10)
+                return
+            # Get the JSON data from the response if it succeeded
+            api_data = response.json()
+            # Take the start and finish times from the data and convert them to strings and timestamps
+            output = convert_timestamps(api_data.get("start"), api_data.get("finish"))
+            # Create an empty embed
+            embed = discord.Embed()
+            # Set the title of the embed
+            embed.title = api_data.get("title")
+            # Add a field for the URL
+            embed.add_field(name="URL", value=api_data.get("url"), inline=False)
+            # Add a field for the CTF ID
+            embed.add_field(name="CTF ID", value=id, inline=True)
+            # Add the team name and password to the embed
+            # If there is team data
+            if team_data is not None:
+                # If there is only 1 set of credentials
+                if team_data == 1:
+                    embed.add_field(name="Team Name", value=team_data.get("team_name"), inline=True)
+                    embed.add_field(name="Team Password", value=team_data.get("team_password"), inline=True)
+                # If there are more than 1 set of credentials
+                else:
+                    # Take the team names and passwords and put them in a string
+                    team_name_string = ""
+                    team_password_string = ""
+                    for data in team_data:
+                        if len(team_name_string) == 0:
+                            team_name_string = data.get("team_name")
+                            team_password_string = data.get("team_password")
+                        else:
+                            # Commas and newlines are added to make it easier to read
+                            team_name_string = team_name_string + ",\n" + data.get("team_name")
+                            team_password_string = team_password_string + ",\n" + data.get("team_password")
+                    # Add the team names and passwords to the embed
+                    embed.add_field(name="Team Names", value=team_name_string, inline=True)
+                    embed.add_field(name="Team Passwords", value=team_password_string, inline=True)
+            # If there is no team data in the database
+            else:
+                # Add None to the fields
+                embed.add_field(name="Team Name", value="None", inline=True)
+                embed.add_field(name="Team Password", value="None", inline=True)
+            # Add a field for the start and finish times
+            embed.add_field(name="Start", value=output.get("start_string"), inline=True)
+            embed.add_field(name="Finish", value=output.get("finish_string"), inline=True)
+            # Add a field for the format
+            embed.add_field(name="Format", value=api_data.get("format"), inline=True)
+            # Get the logo URL
+            logo_url = api_data.get("logo")
+            # If there is a logo URL
+            if logo_url is not None and logo_url != "":
+                # Attempt to get the logo data
+                logo_data = self.services.http.get(logo_url)
+                # If the status code is 200, the logo was found
+                if logo_data.status_code == 200:
+                    # Create a file object from the logo data
+                    file = io.BytesIO(logo_data.content)
+                    # Add the file to the embed
+                    test = discord.File(file, filename="logo.png")
+                    # Set the thumbnail to the file
+                    embed.set_thumbnail(url="attachment://logo.png")
+            # If there is no logo, set the file to None
+            else:
+                file = None
+            # If there is a description
+            if api_data.get("description") is not None and api_data.get("description") != "":
+                # Get the description
+                description = api_data.get("description")
+                # If the description is longer than 1024 characters, truncate it
+                if len(description) > 1023:
+                    CUT_AT = [' ', '\n', '\t', '\r', '.']
+                    description = api_data.get("description")[:1023]
+                    while description[len(description) - 1] not in CUT_AT:
+                        description = description[:len(description) - 1]
+                # Add the description to the embed
+                embed.add_field(name="Description", value=description, inline=False)
+            # If a logo was found, send the file with the embed
+            if file != None and logo_data.status_code == 200:
+                await ctx.send(file=test, embed=embed)
+                # After a successful send, delete the command message
+                await ctx.message.delete()
+            # If no logo was found, send the embed without the file
+            else:
+                await ctx.send(embed=embed)
+                # After a successful send, delete the command message
+                await ctx.message.delete()
+            return
+        #  If it is not a string or integer, send an error message
+        else:
+            # Send an error message that will be deleted after 10 seconds
+            await ctx.send("Error: ID must be a string or integer", delete_after=10)
+            await asyncio.sleep(10)
+            # Delete the command message
+            await ctx.message.delete()
+            # Return to prevent further execution
+            return
+
+async def setup(bot: commands.Bot):
+    """Adds the CTF commands to the bot when the extension is loaded"""
+    await bot.add_cog(CTF(bot))
@@ -0,0 +1,66 @@
+import time
+from discord.ext import commands, tasks
+from ..config import CLEAN_DB_HOURS, DAYS_TO_KEEP
+
+class Database(commands.Cog):
+    """The tasks and commands for keeping the database clean"""
+
+    def __init__(self, bot: commands.Bot):
+        self.bot = bot
+        # The shared connections and caches, these outlive reloads of this extension
+        self.services = bot.services
+
+    async def cog_load(self):
+        """Starts the clean_db task when the extension is loaded"""
+        self.clean_db.start()
+
+    async def cog_unload(self):
+        """Stops the clean_db task when the extension is unloaded, so a reload
+        doesn't leave two copies of it running
+        """
+        self.clean_db.cancel()
+
+    @tasks.loop(hours=1)
+    async def clean_db(self):
+        """Cleans the database of extra data to save space. It will remove all data
+        for CTFs that have finished more than 7 days ago. This will clean every
+        24 hours. The time of the next clean is kept in the shared services, and the
+        loop only checks it every hour, so reloading this extension doesn't clean
+        the database early.
+        """
+        # If it isn't time to clean the database yet, do nothing
+        if time.time() < self.services.next_clean_db:
+            return
+        self.services.next_clean_db = time.time() + CLEAN_DB_HOURS * 3600
+        print("Cleaning database")
+        removed = 0
+        # Get all the data from the database where the finish timestamp is less than
+        # the current time + the number of days to keep
+        all_data = self.services.collection.find({"finish": {"$lt": time.time() - DAYS_TO_KEEP * 86400}})
+        for i in all_data:
+            self.services.collection.delete_one({"_id": i.get("_id")})
+            self.services.credential_cache.invalidate(i.get("ctf_id"))
+            removed = removed + 1
+        # Get the number of documents removed
+        print("Removed {} documents".format(removed))
+
+    @commands.command('force_clean_db')
+    async def force_clean_db(self, ctx):
+        """Forces the database to be cleaned just like the clean_db function. This
+        will remove all data for CTFs that have finished more than 7 days ago.
+        """
+        print("Cleaning database")
+        # Get all the data from the database where the finish timestamp is less than
+        # the current time + the number of days to keep
+        all_data = self.services.collection.delete_many({"finish": {"$lt": time.time() - DAYS_TO_KEEP * 86400}})
+        # Get the number of documents removed
+        removed = all_data.deleted_count
+        # The deleted CTF IDs aren't known, so drop everything if anything was removed
+        if removed > 0:
+            self.services.credential_cache.invalidate()
+        print("Removed {} documents".format(removed))
+        await ctx.send("Removed {} documents".format(removed))
+
+async def setup(bot: commands.Bot):
+    """Adds the database tasks and commands to the bot when the extension is loaded"""
+    await bot.add_cog(Database(bot))
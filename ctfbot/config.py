@@ -0,0 +1,39 @@
+# First import the dotenv module and load the .env file
+# This needs to be done before reading any of the environment variables
+from dotenv import load_dotenv
+load_dotenv()
+import os
+
+# Get the token from the environment variables
+TOKEN = os.getenv('TOKEN')
+MONGO_USER = os.getenv("MONGO_USER")
+MONGO_PASSWORD = os.getenv("MONGO_PASSWORD")
+MONGO_HOST = os.getenv("MONGO_HOST")
+# An optional full connection string, used instead of the Atlas one if it is set
+# Mostly useful for testing against a local replica set
+MONGO_URL = os.getenv("MONGO_URL")
+
+# The general URL for the CTFTime API
+GENERAL_URL = "https://ctftime.org/api/v1/events/?limit={}&start={}&finish={}"
+# The URL for a specific CTF
+EVENT_URL = "https://ctftime.org/api/v1/events/{}/"
+# The user agent for the bot
+HEADERS = {'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_11_5) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/50.0.2661.102 Safari/537.36'}
+# The maximum number of CTFs to get from the API
+CTF_LIMIT = 100
+# The number of seconds to wait for a response from the CTFTime API
+REQUEST_TIMEOUT = 10
+# The description of the bot for the help command
+DESCRIPTION = '''A bot that is part of the IASG Discord server'''
+# The prefix for the bot
+COMMAND_PREFIX = '//'
+# The number of days to keep a username and password in the database after the CTF is over
+DAYS_TO_KEEP = 7
+# The number of hours between each time the clean_db task cleans the database
+CLEAN_DB_HOURS = 24
+# The number of seconds to wait before reopening the change stream after an error
+WATCH_RETRY_SECONDS = 5
+# The maximum number of CTF IDs to keep in the credential cache
+CACHE_MAX_ENTRIES = 1024
+# The maximum number of CTFTime API requests to have running at once for a bulk import
+BULK_LOOKUP_LIMIT = 5
@@ -0,0 +1,84 @@
+import requests
+import threading
+from pymongo.mongo_client import MongoClient
+from pymongo.server_api import ServerApi
+from .cache import CredentialCache
+from .config import EVENT_URL, HEADERS, MONGO_HOST, MONGO_PASSWORD, MONGO_URL, MONGO_USER, REQUEST_TIMEOUT
+
+class Services:
+    """The connections and caches shared by all of the bot's extensions.
+
+    This is created once when the bot starts and is stored on the bot as
+    bot.services. The extensions only ever get it from there, so reloading an
+    extension keeps the same MongoDB client, CTFTime sessions and warm credential
+    cache instead of making new ones.
+    """
+
+    def __init__(self):
+        """Connects to MongoDB and creates the CTFTime session and credential cache
+
+        Raises:
+            Exception: If the MongoDB deployment can not be pinged
+        """
+        # Create the MongoDB client
+        url = f"mongodb+srv://{MONGO_USER}:{MONGO_PASSWORD}@{MONGO_HOST}/?retryWrites=true&w=majority"
+        if MONGO_URL:
+            url = MONGO_URL
+        self.client = MongoClient(url, server_api=ServerApi('1'))
+        self.client.admin.command('ping')
+        print("Pinged your deployment. You successfully connected to MongoDB!")
+        # Get the correct database and collection to use for the bot
+        self.db = self.client.get_database("ctf_passwords")
+        self.collection = self.db.get_collection("passwords")
+        # Create the credential cache for the collection
+        self.credential_cache = CredentialCache(self.collection)
+        # Sessions for the CTFTime API and logos, so connections are reused. Bulk
+        # imports look CTFs up from several threads, and a requests session isn't
+        # safe to share between threads, so each thread gets its own
+        self._sessions = threading.local()
+        # The unix timestamp of the next time the clean_db task should run, kept
+        # here so reloading the database extension keeps the schedule
+        self.next_clean_db = 0
+
+    @property
+    def http(self) -> requests.Session:
+        """The requests session for the current thread, created the first time it is used"""
+        session = getattr(self._sessions, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update(HEADERS)
+            self._sessions.session = session
+        return session
+
+    def get_ctf_event(self, ctf_id: int) -> tuple:
+        """Gets the data for a single CTF from the CTFTime API
+
+        Args:
+            ctf_id (int): The CTFTime ID of the CTF
+
+        Returns:
+            tuple: A tuple containing the JSON data for the CTF, or None if it wasn't
+            returned, and an error string, or None if the data was returned. The error
+            is "not found" if CTFTime doesn't know the CTF ID, and describes the failure
+            otherwise (data, error)
+        """
+        # Print the URL for debugging
+        print(EVENT_URL.format(ctf_id))
+        try:
+            response = self.http.get(EVENT_URL.format(ctf_id), timeout=REQUEST_TIMEOUT)
+        except requests.RequestException as e:
+            print(e)
+            return (None, "request failed")
+        # A 404 means CTFTime doesn't have the CTF, anything else is the API failing
+        if response.status_code == 404:
+            return (None, "not found")
+        if response.status_code != 200:
+            return (None, "status code {}".format(response.status_code))
+        try:
+            data = response.json()
+        except ValueError:
+            return (None, "invalid JSON")
+        # If the data is empty, the CTF was not found
+        if len(data) == 0:
+            return (None, "not found")
+        return (data, None)
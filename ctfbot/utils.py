@@ -0,0 +1,118 @@
+import csv
+import io
+import json
+import pytz
+import time
+from datetime import datetime
+
+def get_times(days: int = 7) -> tuple:
+    """Takes a number of days and returns the current unix timestamp and the future unix
+    timestamp based on the number of days
+    
+    Args:
+        days (int, optional): The number of days to add to the current time. Defaults to 7.
+        
+    Returns:
+        tuple: A tuple containing the current unix timestamp and the future unix timestamp
+        (current, future)
+    """
+    current = round(time.time())
+    # Add 7 days to current time
+    future = round(current + (days * 86400))
+    return (current, future)
+
+def convert_timestamps(start: str, finish: str) -> dict:
+    """Converts the start and finish times to strings and timestamps
+    
+    Args:
+        start (str): The start time in ISO format
+        finish (str): The finish time in ISO format
+    
+    Returns:
+        dict: A dict containing the start and finish times as strings in Central Time 
+        and unix timestamps. Along with including prior timestamps to get the current CTFs
+        TODO: Add the code for the prior times to get current CTFs, it can probably be defaulted to 7 days?
+        Example:
+        {
+            "prior_string": "Central Time String",
+            "prior_timestamp": unix_timestamp,
+            "start_string": "Central Time String",
+            "start_timestamp": unix_timestamp,
+            "finish_string": "Central Time String",
+            "finish_timestamp": unix_timestamp
+        }
+    """
+    start_time = datetime.fromisoformat(start)
+    finish_time = datetime.fromisoformat(finish)
+    start_string = start_time.astimezone(pytz.timezone('US/Central')).strftime("%d %b %Y %I:%S %p %Z")
+    start_timestamp = round(start_time.timestamp())
+    finish_string = finish_time.astimezone(pytz.timezone('US/Central')).strftime("%d %b %Y %I:%S %p %Z")
+    finish_timestamp = round(finish_time.timestamp())
+    return {
+        "start_string": start_string,
+        "start_timestamp": start_timestamp,
+        "finish_string": finish_string,
+        "finish_timestamp": finish_timestamp
+    }
+
+def parse_bulk_credentials(filename: str, content: bytes) -> tuple:
+    """Parses a CSV or JSON file of CTF credentials for a bulk import. A CSV file has
+    a row of ctf_id,team_name,team_password for each set of credentials, with an
+    optional header row. Spaces after the commas are ignored, so a password that
+    starts with a space has to be quoted. A JSON file is a list of objects with
+    ctf_id, team_name and team_password keys, or a list of
+    [ctf_id, team_name, team_password] lists. Passwords are kept exactly as given.
+
+    Args:
+        filename (str): The name of the attached file, used to tell CSV and JSON apart
+        content (bytes): The contents of the attached file
+
+    Returns:
+        tuple: A tuple containing a list of valid (ctf_id, team_name, team_password)
+        tuples, and a list of error strings for the rows that could not be used
+        (credentials, errors). Errors give the line of the file for CSV, and the
+        position in the list for JSON.
+
+    Raises:
+        ValueError: If the file can not be decoded or parsed at all
+    """
+    text = content.decode("utf-8-sig")
+    # Get the rows out of the file as lists or dicts, along with where they are in
+    # the file so errors point at the right place
+    if filename.lower().endswith(".json"):
+        data = json.loads(text)
+        if type(data) != list:
+            raise ValueError("JSON file must contain a list")
+        rows = [("Item {}".format(number), row) for number, row in enumerate(data, start=1)]
+    else:
+        # Spaces after the commas are dropped, so quote a value to keep spaces at its start
+        reader = csv.reader(io.StringIO(text), skipinitialspace=True)
+        rows = [("Line {}".format(reader.line_num), row) for row in reader if len(row) > 0]
+        # Skip the header row if there is one
+        if len(rows) > 0 and rows[0][1][0].strip().lower() == "ctf_id":
+            rows = rows[1:]
+    credentials = []
+    errors = []
+    for position, row in rows:
+        # Pull the three values out of the row, no matter the format
+        if type(row) == dict:
+            values = [row.get("ctf_id"), row.get("team_name"), row.get("team_password")]
+        elif type(row) == list and len(row) == 3:
+            values = row
+        else:
+            errors.append("{}: expected ctf_id, team_name and team_password".format(position))
+            continue
+        # The CTF ID has to be an integer
+        try:
+            ctf_id = int(str(values[0]).strip())
+        except ValueError:
+            errors.append("{}: CTF ID \"{}\" is not an integer".format(position, values[0]))
+            continue
+        # The team name and password have to be non empty strings, but a password
+        # of only spaces is still a password
+        if type(values[1]) != str or type(values[2]) != str or values[1].strip() == "" or values[2] == "":
+            errors.append("{}: team name and password must be non empty strings".format(position))
+            continue
+        # Spaces around the password could be part of it, so it is kept as is
+        credentials.append((ctf_id, values[1].strip(), values[2]))
+    return (credentials, errors)
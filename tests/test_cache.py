@@ -0,0 +1,144 @@
+import queue
+import time
+import pytest
+from ctfbot import cache
+from ctfbot.cache import CredentialCache
+
+class StopWatching(Exception):
+    """Raised by the fake change stream to stop the watcher thread"""
+
+class FakeStream:
+    """A change stream that hands out the events put on its queue"""
+
+    def __init__(self):
+        self.events = queue.Queue()
+        self.resume_token = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def __iter__(self):
+        while True:
+            event = self.events.get()
+            if event is None:
+                raise StopWatching()
+            yield event
+
+class FakeCollection:
+    """A collection that keeps documents in a list. on_find is run after the
+    documents for a find are picked, to act like a write landing mid read.
+    """
+
+    def __init__(self, documents=None):
+        self.documents = documents or []
+        self.stream = FakeStream()
+        self.on_find = None
+
+    def find(self, query, projection=None):
+        found = [dict(document) for document in self.documents if document["ctf_id"] == query["ctf_id"]]
+        if self.on_find is not None:
+            on_find, self.on_find = self.on_find, None
+            on_find()
+        return iter(found)
+
+    def watch(self, **kwargs):
+        return self.stream
+
+def document(_id, ctf_id, team_name):
+    return {"_id": _id, "ctf_id": ctf_id, "credentials": {"team_name": team_name, "team_password": "pw"}}
+
+@pytest.fixture
+def collection():
+    return FakeCollection([document("a", 1, "old")])
+
+@pytest.fixture
+def credential_cache(collection):
+    credential_cache = CredentialCache(collection)
+    credential_cache.enabled = True
+    return credential_cache
+
+def team_names(credentials):
+    return [credential["team_name"] for credential in credentials]
+
+def test_get_caches_and_negative_caches(collection, credential_cache):
+    assert team_names(credential_cache.get(1)) == ["old"]
+    assert credential_cache.get(2) == []
+    collection.documents = []
+    # Both the found and the empty result come from the cache now
+    assert team_names(credential_cache.get(1)) == ["old"]
+    assert credential_cache.get(2) == []
+
+def test_read_racing_invalidate_is_not_stored(collection, credential_cache):
+    def write():
+        collection.documents = [document("b", 1, "new")]
+        credential_cache.invalidate(1)
+    collection.on_find = write
+    credential_cache.get(1)
+    assert team_names(credential_cache.get(1)) == ["new"]
+
+def test_delete_of_uncached_document_during_read(collection, credential_cache):
+    def delete():
+        collection.documents = []
+        credential_cache._handle_change({"operationType": "delete", "documentKey": {"_id": "a"}})
+    collection.on_find = delete
+    credential_cache.get(1)
+    assert credential_cache.get(1) == []
+
+def test_update_moving_document_to_another_ctf_id(collection, credential_cache):
+    assert team_names(credential_cache.get(1)) == ["old"]
+    assert credential_cache.get(2) == []
+    moved = document("a", 2, "old")
+    collection.documents = [moved]
+    credential_cache._handle_change({"operationType": "update", "documentKey": {"_id": "a"}, "fullDocument": moved})
+    assert credential_cache.get(1) == []
+    assert team_names(credential_cache.get(2)) == ["old"]
+
+def test_lru_eviction(monkeypatch, collection, credential_cache):
+    monkeypatch.setattr(cache, "CACHE_MAX_ENTRIES", 2)
+    credential_cache.get(1)
+    credential_cache.get(2)
+    # Using 1 again makes 2 the least recently used
+    credential_cache.get(1)
+    credential_cache.get(3)
+    assert list(credential_cache._credentials) == [1, 3]
+    assert credential_cache._document_ids == {"a": 1}
+    assert credential_cache._generations == {}
+    assert credential_cache._reads == {}
+
+def wait_for(condition):
+    deadline = time.time() + 5
+    while not condition():
+        assert time.time() < deadline
+        time.sleep(0.01)
+
+# The fake stream stops the watcher thread with an exception
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_stream_opening_during_read_discards_it(collection):
+    credential_cache = CredentialCache(collection)
+    # The read starts while the cache is off, an outside write lands, and then
+    # the stream opens before the read finishes
+    def write_then_open_stream():
+        collection.documents = [document("b", 1, "new")]
+        credential_cache.start_watching()
+        wait_for(lambda: credential_cache.enabled)
+    collection.on_find = write_then_open_stream
+    assert team_names(credential_cache.get(1)) == ["old"]
+    assert team_names(credential_cache.get(1)) == ["new"]
+    collection.stream.events.put(None)
+
+# The fake stream stops the watcher thread with an exception
+@pytest.mark.filterwarnings("ignore::pytest.PytestUnhandledThreadExceptionWarning")
+def test_watcher_dying_disables_cache(collection):
+    credential_cache = CredentialCache(collection)
+    credential_cache.start_watching()
+    wait_for(lambda: credential_cache.enabled)
+    credential_cache.get(1)
+    # Anything the watcher doesn't expect stops it, and the cache has to go off with it
+    collection.stream.events.put(None)
+    wait_for(lambda: not credential_cache.enabled)
+    assert credential_cache._credentials == {}
+    collection.documents = []
+    assert credential_cache.get(1) == []
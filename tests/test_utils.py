@@ -0,0 +1,21 @@
+from ctfbot.utils import parse_bulk_credentials
+
+def test_csv_skips_spaces_after_commas():
+    credentials, errors = parse_bulk_credentials("creds.csv", b"ctf_id,team_name,team_password\n1234, IASG, hunter2\n")
+    assert credentials == [(1234, "IASG", "hunter2")]
+    assert errors == []
+
+def test_csv_keeps_quoted_and_space_only_passwords():
+    credentials, errors = parse_bulk_credentials("creds.csv", b'1,a," hunter2 "\n2,b,"  "\n')
+    assert credentials == [(1, "a", " hunter2 "), (2, "b", "  ")]
+    assert errors == []
+
+def test_csv_errors_use_file_lines():
+    credentials, errors = parse_bulk_credentials("creds.csv", b"ctf_id,team_name,team_password\n1,a,b\n\n2,c\n")
+    assert credentials == [(1, "a", "b")]
+    assert errors == ["Line 4: expected ctf_id, team_name and team_password"]
+
+def test_json_errors_use_list_positions():
+    credentials, errors = parse_bulk_credentials("creds.json", b'[{"ctf_id": "1", "team_name": "a", "team_password": " b"}, [2, "c", ""]]')
+    assert credentials == [(1, "a", " b")]
+    assert errors == ["Item 2: team name and password must be non empty strings"]